@@ -1,5 +1,185 @@
 import pandas as pd
+import numpy as np
+import collections
+import contextlib
+import io
 import os
+import sys
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional - without it the kernels below just run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _compute_metrics(prices, trade_idx, trade_actions, trade_shares, trade_prices, trade_cash,
+                     initial_capital):
+    """
+    Compute Sharpe ratio, max drawdown, win rate and average trade return in one pass
+    
+    Walks the days once, replaying each trade on its day, and keeps running
+    statistics instead of building intermediate portfolio/return series.
+    
+    Args:
+        prices: float64 array of closing prices for every day
+        trade_idx: Day index of each trade, ascending
+        trade_actions: 1 = BUY, -1 = SELL for each trade
+        trade_shares: Shares bought or sold in each trade
+        trade_prices: Fill price of each trade
+        trade_cash: Cash left after each trade
+        initial_capital: Cash before the first trade
+        
+    Returns:
+        Tuple of (sharpe_ratio, max_drawdown, win_rate, avg_trade_return), with
+        drawdown, win rate and trade return in percent
+    """
+    n_trades = len(trade_idx)
+    j = 0
+    cash = initial_capital
+    shares = 0
+    
+    # Running mean/variance of daily returns (Welford's method)
+    n_returns = 0
+    mean_return = 0.0
+    m2 = 0.0
+    prev_value = 0.0
+    
+    running_max = 0.0
+    max_drawdown = 0.0
+    
+    # Cost basis of the open position, plus closed-trade tallies
+    total_cost = 0.0
+    total_shares = 0
+    winning_trades = 0
+    closed_trades = 0
+    sum_trade_returns = 0.0
+    
+    for i in range(len(prices)):
+        # Replay this day's trades in order
+        while j < n_trades and trade_idx[j] <= i:
+            if trade_actions[j] == 1:
+                shares += trade_shares[j]
+                total_cost += trade_shares[j] * trade_prices[j]
+                total_shares += trade_shares[j]
+            else:
+                # A SELL closes the whole position at its weighted average cost basis
+                shares = 0
+                if total_shares > 0:
+                    avg_buy_price = total_cost / total_shares
+                    trade_return = ((trade_prices[j] - avg_buy_price) / avg_buy_price) * 100
+                    sum_trade_returns += trade_return
+                    closed_trades += 1
+                    if trade_return > 0:
+                        winning_trades += 1
+                    total_cost = 0.0
+                    total_shares = 0
+            cash = trade_cash[j]
+            j += 1
+        
+        # Portfolio value = cash + (shares held * current price)
+        value = cash + shares * prices[i]
+        
+        if i > 0:
+            daily_return = (value - prev_value) / prev_value
+            # A missing close leaves no return for that day and the next - skip
+            # them like pct_change().dropna() did
+            if daily_return == daily_return:
+                n_returns += 1
+                delta = daily_return - mean_return
+                mean_return += delta / n_returns
+                m2 += delta * (daily_return - mean_return)
+        prev_value = value
+        
+        # Maximum Drawdown (calculated from portfolio values, not returns)
+        if i == 0 or value > running_max:
+            running_max = value
+        drawdown = (value - running_max) / running_max
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+    
+    # Sharpe Ratio (annualized, assuming 252 trading days), sample standard deviation
+    sharpe_ratio = 0.0
+    if n_returns > 1:
+        std_return = np.sqrt(m2 / (n_returns - 1))
+        if std_return > 0:
+            sharpe_ratio = (mean_return / std_return) * np.sqrt(252)
+    
+    # Open positions at the end are not counted in win rate
+    win_rate = 0.0
+    avg_trade_return = 0.0
+    if closed_trades > 0:
+        win_rate = winning_trades / closed_trades * 100
+        avg_trade_return = sum_trade_returns / closed_trades
+    
+    return sharpe_ratio, max_drawdown * 100, win_rate, avg_trade_return
+
+
+# One row of the trade log
+Trade = collections.namedtuple('Trade', 'Date Action Price Shares Cash PortfolioValue')
+
+
+@njit(cache=True)
+def _run_backtest(prices, signals, active_idx, cash, shares):
+    """
+    Simulate fills on the days that carry a signal
+    
+    Args:
+        prices: float64 array of closing prices
+        signals: int8 array of signals (1 = buy, -1 = sell, 0 = hold)
+        active_idx: Indices of the days to visit, in order
+        cash: Starting cash
+        shares: Starting share count
+        
+    Returns:
+        Tuple of (trade_idx, trade_actions, trade_shares, trade_cash, trade_values,
+        cash, shares) - the trade arrays are trimmed to the number of trades made
+    """
+    n = len(active_idx)
+    trade_idx = np.empty(n, np.int64)
+    trade_actions = np.empty(n, np.int8)
+    trade_shares = np.empty(n, np.int64)
+    trade_cash = np.empty(n, np.float64)
+    trade_values = np.empty(n, np.float64)
+    n_trades = 0
+    
+    for k in active_idx:
+        price = prices[k]
+        
+        # BUY signal and we have cash
+        if signals[k] == 1 and cash > 0:
+            shares_to_buy = int(cash / price)
+            if shares_to_buy > 0:
+                cash -= shares_to_buy * price
+                shares += shares_to_buy
+                
+                trade_idx[n_trades] = k
+                trade_actions[n_trades] = 1
+                trade_shares[n_trades] = shares_to_buy
+                trade_cash[n_trades] = cash
+                trade_values[n_trades] = cash + shares * price
+                n_trades += 1
+        
+        # SELL signal and we have shares
+        elif signals[k] == -1 and shares > 0:
+            cash += shares * price
+            
+            trade_idx[n_trades] = k
+            trade_actions[n_trades] = -1
+            trade_shares[n_trades] = shares
+            trade_cash[n_trades] = cash
+            trade_values[n_trades] = cash
+            n_trades += 1
+            
+            shares = 0
+    
+    return (trade_idx[:n_trades], trade_actions[:n_trades], trade_shares[:n_trades],
+            trade_cash[:n_trades], trade_values[:n_trades], cash, shares)
+
 
 class SimpleBacktester:
     """A simple backtesting engine for testing trading strategies"""
@@ -14,25 +194,107 @@ class SimpleBacktester:
         self.initial_capital = initial_capital
         self.cash = initial_capital
         self.shares = 0
-        self.trades = []
+        
+        # Trade log stored column-wise (action: 1 = BUY, -1 = SELL; row: position
+        # of the trade's day in the data it was backtested on)
+        self._trade_rows = []
+        self._trade_dates = []
+        self._trade_actions = []
+        self._trade_prices = []
+        self._trade_shares = []
+        self._trade_cash = []
+        self._trade_values = []
+    
+    @property
+    def trades(self):
+        """Trade log as a list of Trade tuples, built on demand from the column lists"""
+        return [
+            Trade(date, 'BUY' if action == 1 else 'SELL', price, shares, cash, value)
+            for date, action, price, shares, cash, value in zip(
+                self._trade_dates, self._trade_actions, self._trade_prices,
+                self._trade_shares, self._trade_cash, self._trade_values)
+        ]
     
     def load_data(self, csv_path):
-        """Load stock data from CSV file"""
+        """
+        Load stock data from a CSV or Parquet file
+        
+        A parsed CSV is cached next to it as a Parquet file and reused until the
+        CSV is modified again.
+        """
         print(f"Loading data from {csv_path}...")
         
-        # Read CSV, skipping the second header row
-        data = pd.read_csv(csv_path, skiprows=[1])
+        # Parse price columns as numbers straight away
+        # float32 keeps ~7 significant digits, plenty for prices, at half the memory.
+        # Volume stays 64-bit - split-adjusted volumes can exceed 2**31 - and nullable,
+        # so a blank cell loads as missing
+        dtypes = {
+            'Date': str,
+            'Open': 'float32',
+            'High': 'float32',
+            'Low': 'float32',
+            'Close': 'float32',
+            'Volume': 'Int64'
+        }
         
-        # Convert price columns to numeric
-        price_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-        for col in price_columns:
-            if col in data.columns:
-                data[col] = pd.to_numeric(data[col], errors='coerce')
+        # Parquet files saved by DataFetcher are already typed - just match the CSV dtypes
+        if csv_path.endswith('.parquet'):
+            data = pd.read_parquet(csv_path)
+            data = data.astype({col: dtype for col, dtype in dtypes.items() if col in data.columns})
+            print(f"✓ Loaded {len(data)} days of data")
+            return data
+        
+        pq_path = csv_path + '.parquet'
+        if os.path.exists(pq_path) and os.path.getmtime(pq_path) >= os.path.getmtime(csv_path):
+            try:
+                data = pd.read_parquet(pq_path)
+            except ImportError:
+                # No Parquet engine installed - fall back to the CSV
+                pass
+            else:
+                print(f"✓ Loaded {len(data)} days of data (cached)")
+                return data
+        
+        try:
+            data = self._read_csv(csv_path, dtypes)
+        except (ValueError, TypeError):
+            # A malformed or fractional number somewhere - read everything as text,
+            # turn bad values into NaN and round fractional volumes to whole shares
+            data = self._read_csv(csv_path, str)
+            for col, dtype in dtypes.items():
+                if col != 'Date' and col in data.columns:
+                    values = pd.to_numeric(data[col], errors='coerce')
+                    if dtype == 'Int64':
+                        values = values.round()
+                    data[col] = values.astype(dtype)
+        
+        # Write to a temp file first so a concurrent reader never sees a partial cache
+        tmp_path = f"{pq_path}.{os.getpid()}.tmp"
+        try:
+            data.to_parquet(tmp_path, compression='snappy')
+            os.replace(tmp_path, pq_path)
+        except (ImportError, OSError):
+            # No Parquet engine, read-only directory or full disk - the cache is
+            # optional, so just skip it
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
         
         print(f"✓ Loaded {len(data)} days of data")
 
         return data
     
+    def _read_csv(self, csv_path, dtypes):
+        """Read a CSV with the given dtype (or column -> dtype dict), skipping the second header row"""
+        try:
+            # PyArrow's multi-threaded reader only takes an integer skiprows, so pass
+            # the header names in and skip both header lines
+            with open(csv_path) as f:
+                names = f.readline().strip().split(',')
+            return pd.read_csv(csv_path, engine='pyarrow', skiprows=2, header=None,
+                               names=names, dtype=dtypes)
+        except ImportError:
+            return pd.read_csv(csv_path, skiprows=[1], dtype=dtypes)
+    
     def apply_strategy(self, data, strategy):
         """
         Apply a trading strategy to generate signals
@@ -44,66 +306,71 @@ class SimpleBacktester:
         Returns:
             DataFrame with signals
         """
-        return strategy.generate_signals(data)
+        data_with_signals = strategy.generate_signals(data)
+        
+        # Signals are only ever -1/0/1, so store them as int8
+        data_with_signals['Signal'] = data_with_signals['Signal'].astype(np.int8)
+        
+        return data_with_signals
         
     
-    def execute_backtest(self, data_with_signals, warmup_period=50):
+    def execute_backtest(self, data_with_signals, warmup_period=50, verbose=False):
         """
         Execute trades based on signals
         
         Args:
             data_with_signals: DataFrame with 'Signal' column
             warmup_period: Number of days to skip at start (for indicator calculation)
+            verbose: Print each trade (written in one batch after the run)
         """
         print("\n=== Running Backtest ===\n")
         
-        # Skip warmup period to ensure fair comparison
-        for i, row in data_with_signals.iloc[warmup_period:].iterrows():
-            date = row['Date']
-            price = row['Close']
-            signal = row['Signal']
-            
-            # BUY signal and we have cash
-            if signal == 1 and self.cash > 0:
-                shares_to_buy = int(self.cash / price)
-                if shares_to_buy > 0:
-                    cost = shares_to_buy * price
-                    self.cash -= cost
-                    self.shares += shares_to_buy
-                    
-                    self.trades.append({
-                        'Date': date,
-                        'Action': 'BUY',
-                        'Price': price,
-                        'Shares': shares_to_buy,
-                        'Cash': self.cash,
-                        'Portfolio Value': self.cash + (self.shares * price)
-                    })
-                    print(f"{date}: BUY {shares_to_buy} shares at ${price:.2f} | Cash: ${self.cash:.2f}")
-            
-            # SELL signal and we have shares
-            elif signal == -1 and self.shares > 0:
-                revenue = self.shares * price
-                self.cash += revenue
-                
-                self.trades.append({
-                    'Date': date,
-                    'Action': 'SELL',
-                    'Price': price,
-                    'Shares': self.shares,
-                    'Cash': self.cash,
-                    'Portfolio Value': self.cash
-                })
-                print(f"{date}: SELL {self.shares} shares at ${price:.2f} | Cash: ${self.cash:.2f}")
-                
-                self.shares = 0
+        # Pull the needed columns out once as arrays instead of building a Series per row
+        dates = data_with_signals['Date'].to_numpy()
+        prices = data_with_signals['Close'].to_numpy(dtype=np.float64)
+        signals = data_with_signals['Signal'].to_numpy(dtype=np.int8)
+        
+        # Skip warmup period to ensure fair comparison, and only visit days that
+        # carry a signal - hold days (Signal == 0) never change cash or shares
+        active_idx = np.flatnonzero(signals[warmup_period:] != 0) + warmup_period
+        
+        (trade_idx, trade_actions, trade_shares, trade_cash, trade_values,
+         self.cash, self.shares) = _run_backtest(prices, signals, active_idx,
+                                                 float(self.cash), int(self.shares))
+        
+        # Append this run's trades to the column lists
+        first_trade = len(self._trade_actions)
+        self._trade_rows.extend(trade_idx)
+        self._trade_dates.extend(dates[trade_idx])
+        self._trade_actions.extend(trade_actions)
+        self._trade_prices.extend(prices[trade_idx])
+        self._trade_shares.extend(trade_shares)
+        self._trade_cash.extend(trade_cash)
+        self._trade_values.extend(trade_values)
+        
+        if verbose:
+            self.print_trades(start=first_trade)
+    
+    def print_trades(self, start=0):
+        """
+        Print the trade log in a single write
+        
+        Args:
+            start: Index of the first trade to print (default 0, the whole log)
+        """
+        log_lines = [
+            f"{trade.Date}: {trade.Action} {trade.Shares} shares at ${trade.Price:.2f} | "
+            f"Cash: ${trade.Cash:.2f}"
+            for trade in self.trades[start:]
+        ]
+        if log_lines:
+            sys.stdout.write('\n'.join(log_lines) + '\n')
     
     def calculate_performance(self, final_price, data_with_signals):
         """Calculate comprehensive performance metrics"""
-        import numpy as np
         
-        # Final portfolio value
-        final_value = self.cash + (self.shares * final_price)
+        # Final portfolio value (float() so a float32 close doesn't drag the sum down to float32)
+        final_value = self.cash + (self.shares * float(final_price))
         
         # Total return
         total_return = ((final_value - self.initial_capital) / self.initial_capital) * 100
@@ -111,99 +378,26 @@ class SimpleBacktester:
         # Profit/Loss
         profit_loss = final_value - self.initial_capital
         
-        # Calculate daily returns for Sharpe ratio and drawdown
-        if len(self.trades) > 0:
-            # Build portfolio value series
-            portfolio_values = []
-            cash = self.initial_capital
-            shares = 0
-            
-            # Create a dictionary of trades by date for efficient lookup
-            trades_by_date = {}
-            for trade in self.trades:
-                date = trade['Date']
-                if date not in trades_by_date:
-                    trades_by_date[date] = []
-                trades_by_date[date].append(trade)
-            
-            for _, row in data_with_signals.iterrows():
-                price = row['Close']
-                date = row['Date']
-                
-                # Check if we made a trade this day
-                if date in trades_by_date:
-                    # Process all trades on this day in order
-                    for trade in trades_by_date[date]:
-                        if trade['Action'] == 'BUY':
-                            # trade['Shares'] is shares bought in this trade, so add to cumulative
-                            shares += trade['Shares']
-                            cash = trade['Cash']
-                        elif trade['Action'] == 'SELL':
-                            # After sell, shares go to 0
-                            shares = 0
-                            cash = trade['Cash']
-                
-                # Portfolio value = cash + (shares held * current price)
-                portfolio_value = cash + (shares * price)
-                portfolio_values.append(portfolio_value)
-            
-            # Calculate daily returns
-            portfolio_series = pd.Series(portfolio_values)
-            daily_returns = portfolio_series.pct_change().dropna()
-            
-            # Sharpe Ratio (annualized, assuming 252 trading days)
-            if len(daily_returns) > 0 and daily_returns.std() > 0:
-                sharpe_ratio = (daily_returns.mean() / daily_returns.std()) * np.sqrt(252)
-            else:
-                sharpe_ratio = 0
-            
-            # Maximum Drawdown (calculated from portfolio values, not returns)
-            portfolio_series = pd.Series(portfolio_values)
-            running_max = portfolio_series.expanding().max()
-            drawdown = (portfolio_series - running_max) / running_max
-            max_drawdown = drawdown.min() * 100
-            
-            
-            # Win Rate and Average Trade Return
-            winning_trades = 0
-            losing_trades = 0
-            trade_returns = []
-            
-            # Pair up buy/sell trades properly
-            # Track open positions: each BUY adds shares at a price, each SELL closes all shares
-            # We'll use weighted average cost basis for simplicity
-            total_shares = 0
-            total_cost = 0.0  # Total cost basis for all shares held
-            
-            for trade in self.trades:
-                if trade['Action'] == 'BUY':
-                    # Add shares to our position
-                    shares_bought = trade['Shares']
-                    buy_price = trade['Price']
-                    total_cost += shares_bought * buy_price
-                    total_shares += shares_bought
-                elif trade['Action'] == 'SELL':
-                    # Close all positions - calculate return based on average cost basis
-                    if total_shares > 0:
-                        avg_buy_price = total_cost / total_shares
-                        sell_price = trade['Price']
-                        trade_return = ((sell_price - avg_buy_price) / avg_buy_price) * 100
-                        trade_returns.append(trade_return)
-                        
-                        if trade_return > 0:
-                            winning_trades += 1
-                        else:
-                            losing_trades += 1
-                        
-                        # Reset position tracking after selling all shares
-                        total_shares = 0
-                        total_cost = 0.0
+        # Calculate Sharpe ratio, drawdown and win rate
+        num_trades = len(self._trade_actions)
+        
+        if num_trades > 0:
+            prices = data_with_signals['Close'].to_numpy(dtype=np.float64)
             
-            # Note: If total_shares > 0 at end, we have an open position (not counted in win rate)
+            # Row of each trade's day, recorded by execute_backtest - no date lookup,
+            # so repeated dates are fine (trades past the end of the data are skipped)
+            trade_pos = np.asarray(self._trade_rows, dtype=np.int64)
+            found = trade_pos < len(prices)
             
-            total_closed_trades = winning_trades + losing_trades
-            win_rate = (winning_trades / total_closed_trades * 100) if total_closed_trades > 0 else 0
-            avg_trade_return = np.mean(trade_returns) if trade_returns else 0
+            sharpe_ratio, max_drawdown, win_rate, avg_trade_return = _compute_metrics(
+                prices,
+                trade_pos[found],
+                np.asarray(self._trade_actions, dtype=np.int8)[found],
+                np.asarray(self._trade_shares, dtype=np.int64)[found],
+                np.asarray(self._trade_prices, dtype=np.float64)[found],
+                np.asarray(self._trade_cash, dtype=np.float64)[found],
+                float(self.initial_capital)
+            )
             
         else:
             sharpe_ratio = 0
@@ -216,7 +410,7 @@ class SimpleBacktester:
         print(f"Final Value: ${final_value:.2f}")
         print(f"Profit/Loss: ${profit_loss:.2f}")
         print(f"Total Return: {total_return:.2f}%")
-        print(f"Number of Trades: {len(self.trades)}")
+        print(f"Number of Trades: {num_trades}")
         print(f"\n=== Risk Metrics ===")
         print(f"Sharpe Ratio: {sharpe_ratio:.2f}")
         print(f"Maximum Drawdown: {max_drawdown:.2f}%")
@@ -228,7 +422,7 @@ class SimpleBacktester:
             'final_value': final_value,
             'profit_loss': profit_loss,
             'total_return': total_return,
-            'num_trades': len(self.trades),
+            'num_trades': num_trades,
             'sharpe_ratio': sharpe_ratio,
             'max_drawdown': max_drawdown,
             'win_rate': win_rate,
@@ -237,24 +431,66 @@ class SimpleBacktester:
 
 
 
+def run_strategy(strategy_name, strategy, data, initial_capital=10000):
+    """
+    Run a full backtest for one strategy on a fresh backtester
+    
+    Module-level so it can be pickled into a worker process. The printed report
+    is captured and returned rather than written, so the caller can print the
+    reports of parallel runs in a fixed order.
+    
+    Args:
+        strategy_name: Label used in the printed header
+        strategy: Strategy object with generate_signals() method
+        data: DataFrame with OHLCV data (left untouched - strategies add columns to a copy)
+        initial_capital: Starting cash amount (default $10,000)
+        
+    Returns:
+        Tuple of (strategy_name, performance dict, printed report)
+    """
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        print(f"\n{'=' * 70}")
+        print(f"TESTING STRATEGY: {strategy_name}")
+        print('=' * 70)
+        
+        # Create fresh backtester for each strategy
+        backtester = SimpleBacktester(initial_capital=initial_capital)
+        
+        # Generate trading signals using the strategy
+        data_with_signals = backtester.apply_strategy(data, strategy)
+        
+        # Run backtest
+        backtester.execute_backtest(data_with_signals)
+        
+        # Calculate performance
+        final_price = data_with_signals.iloc[-1]['Close']
+        result = backtester.calculate_performance(final_price, data_with_signals)
+    
+    return strategy_name, result, report.getvalue()
+
+
 # Test the backtester with multiple strategies
 if __name__ == "__main__":
-    import os
+    from concurrent.futures import ProcessPoolExecutor
     from strategies import MovingAverageCrossover, RSIStrategy, MomentumStrategy
     
-    # Find the most recent CSV file in data/raw
+    # Find the most recently modified data file in data/raw (single directory pass),
+    # skipping the .csv.parquet caches load_data writes
     data_dir = 'data/raw'
-    csv_files = [f for f in os.listdir(data_dir) if f.endswith('.csv')]
+    with os.scandir(data_dir) as entries:
+        latest_file = max((entry for entry in entries
+                           if entry.name.endswith(('.csv', '.parquet'))
+                           and not entry.name.endswith('.csv.parquet')),
+                          key=lambda entry: entry.stat().st_mtime, default=None)
     
-    if not csv_files:
-        print("Error: No CSV files found in data/raw/")
+    if latest_file is None:
+        print("Error: No data files found in data/raw/")
         print("Run data_fetcher.py first to download data!")
     else:
-        # Use the most recent file
-        latest_file = max(csv_files)
-        csv_path = os.path.join(data_dir, latest_file)
+        csv_path = latest_file.path
         
-        print(f"Using data file: {latest_file}\n")
+        print(f"Using data file: {latest_file.name}\n")
         print("=" * 70)
         
         # Test all three strategies
@@ -264,31 +500,23 @@ if __name__ == "__main__":
             'RSI': RSIStrategy(period=14, oversold=30, overbought=70)
         }
         
+        # Load data once and share it across all strategies
+        data = SimpleBacktester().load_data(csv_path)
+        
+        # Strategies are independent, so run them side by side in worker processes.
+        # Reports are collected in the order the strategies were listed, so the
+        # output doesn't depend on which worker finishes first
         results = {}
+        max_workers = min(len(strategies), os.cpu_count() or 1)
         
-        for strategy_name, strategy in strategies.items():
-            print(f"\n{'=' * 70}")
-            print(f"TESTING STRATEGY: {strategy_name}")
-            print('=' * 70)
-            
-            # Create fresh backtester for each strategy
-            backtester = SimpleBacktester(initial_capital=10000)
-            
-            # Load data
-            data = backtester.load_data(csv_path)
-            
-            # Generate trading signals using the strategy
-            # Generate trading signals using the strategy
-            data_with_signals = backtester.apply_strategy(data, strategy)
-
-            # Run backtest
-            backtester.execute_backtest(data_with_signals)
-            
-            # Calculate performance
-            final_price = data_with_signals.iloc[-1]['Close']
-            result = backtester.calculate_performance(final_price, data_with_signals)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run_strategy, strategy_name, strategy, data)
+                       for strategy_name, strategy in strategies.items()]
             
-            results[strategy_name] = result
+            for future in futures:
+                strategy_name, result, report = future.result()
+                sys.stdout.write(report)
+                results[strategy_name] = result
         
         # Summary comparison
         print("\n" + "=" * 100)
@@ -1,4 +1,282 @@
 import pandas as pd
+import numpy as np
+import collections
+import functools
+from itertools import product
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    # numba is optional - without it the kernels below just run as plain Python
+    HAS_NUMBA = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import bottleneck as bn
+except ImportError:
+    # bottleneck is optional - moving averages fall back to pandas rolling()
+    bn = None
+
+try:
+    from joblib import Parallel, delayed
+except ImportError:
+    # joblib is optional - parameter sweeps run serially without it
+    Parallel = None
+
+# Moving averages within this relative distance of each other count as equal, so
+# rounding noise on a flat stretch of prices doesn't flip the crossover signal
+MA_TOLERANCE = 1e-9
+
+
+def _moving_mean(values, window):
+    """
+    Trailing simple moving average of a 1-D float64 array
+    
+    Returns NaN until the first full window, like rolling(window).mean().
+    """
+    if bn is not None:
+        # bottleneck rejects windows longer than the data instead of returning all NaN
+        if window > len(values):
+            return np.full(len(values), np.nan)
+        return bn.move_mean(values, window=window, min_count=window)
+    return pd.Series(values).rolling(window=window).mean().to_numpy()
+
+
+@njit(cache=True)
+def _rolling_mean_update(state, window, new_value, old_value):
+    """
+    Slide a trailing mean window forward by one price
+    
+    Works like rolling(window).mean(): Kahan-compensated sums over the non-NaN
+    values in the window, NaN until the window holds `window` of them, and the
+    exact price when the window holds one repeated value.
+    
+    Args:
+        state: float64 array of length 6, zeros to start. Holds the sum, the add
+            and remove compensations, the non-NaN count, the last price and how
+            many times in a row it has repeated
+        window: Number of prices in the window
+        new_value: Price entering the window
+        old_value: Price leaving the window (NaN if none has left yet)
+        
+    Returns:
+        The mean of the window, or NaN while it is incomplete
+    """
+    if new_value == new_value:
+        state[3] += 1
+        y = new_value - state[1]
+        t = state[0] + y
+        state[1] = t - state[0] - y
+        state[0] = t
+        
+        if new_value == state[4]:
+            state[5] += 1
+        else:
+            state[4] = new_value
+            state[5] = 1
+    
+    if old_value == old_value:
+        state[3] -= 1
+        y = -old_value - state[2]
+        t = state[0] + y
+        state[2] = t - state[0] - y
+        state[0] = t
+        
+        if state[3] == 0:
+            # Window emptied - drop any leftover rounding error
+            state[0] = 0.0
+            state[1] = 0.0
+            state[2] = 0.0
+    
+    if state[3] < window:
+        return np.nan
+    if state[5] >= window:
+        return state[4]
+    return state[0] / window
+
+
+@njit(cache=True)
+def _cross_signal(short_value, long_value):
+    """Crossover signal for one bar: 1 = buy, -1 = sell, 0 = hold (NaN or equal MAs)"""
+    tolerance = MA_TOLERANCE * max(abs(short_value), abs(long_value))
+    if short_value - long_value > tolerance:
+        return 1
+    if long_value - short_value > tolerance:
+        return -1
+    return 0
+
+
+@njit(cache=True)
+def _ma_cross(close, short_window, long_window, signal, short_ma, long_ma):
+    """
+    Moving averages and crossover signals in a single pass over the closing prices
+    
+    Keeps a running sum for each window, so Close is read once and every output
+    is written once. A NaN price leaves the averages NaN until it drops out of
+    the window, as with rolling().mean().
+    
+    Args:
+        close: float64 array of closing prices
+        short_window: Period for short moving average
+        long_window: Period for long moving average
+        signal: int8 output array (1 = buy, -1 = sell, 0 = hold)
+        short_ma: float64 output array (NaN until the first full window)
+        long_ma: float64 output array (NaN until the first full window)
+    """
+    short_state = np.zeros(6)
+    long_state = np.zeros(6)
+    
+    for i in range(len(close)):
+        old_short = close[i - short_window] if i >= short_window else np.nan
+        old_long = close[i - long_window] if i >= long_window else np.nan
+        
+        short_value = _rolling_mean_update(short_state, short_window, close[i], old_short)
+        long_value = _rolling_mean_update(long_state, long_window, close[i], old_long)
+        short_ma[i] = short_value
+        long_ma[i] = long_value
+        
+        # NaN compares False, so warmup days hold
+        signal[i] = _cross_signal(short_value, long_value)
+
+
+@njit(cache=True, parallel=True)
+def _batch_ma_cross(close_matrix, short_window, long_window, signal):
+    """
+    Crossover signals for every row of a (n_tickers, n_bars) close matrix
+    
+    Rows are independent, so they are split across threads with prange.
+    
+    Args:
+        close_matrix: C-contiguous float64 array, one ticker per row
+        short_window: Period for short moving average
+        long_window: Period for long moving average
+        signal: int8 output array with the same shape as close_matrix
+    """
+    n_bars = close_matrix.shape[1]
+    for t in prange(close_matrix.shape[0]):
+        short_ma = np.empty(n_bars)
+        long_ma = np.empty(n_bars)
+        _ma_cross(close_matrix[t], short_window, long_window, signal[t], short_ma, long_ma)
+
+
+@njit(cache=True)
+def _wilder_rsi(close, period, out):
+    """
+    Wilder's RSI in a single pass over the closing prices
+    
+    Average gain/loss are seeded with the simple mean of the first `period`
+    price changes, then smoothed with avg = (avg * (period - 1) + x) / period.
+    A change to or from a NaN price counts as no change, so one missing price
+    doesn't leave RSI NaN for the rest of the series.
+    
+    Args:
+        close: float64 array of closing prices
+        period: RSI calculation period
+        out: float64 array the same length as close, filled with RSI values
+            (NaN until the first full period)
+    """
+    n = len(close)
+    out[:min(period + 1, n)] = np.nan
+    if n <= period:
+        return
+    
+    avg_gain = 0.0
+    avg_loss = 0.0
+    
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if delta != delta:
+            # Missing price - treat as no change, like the old rolling version
+            delta = 0.0
+        
+        # Branchless split of the change into gain and loss
+        gain = max(delta, 0.0)
+        loss = max(-delta, 0.0)
+        
+        if i < period:
+            # Accumulate the first period changes, averaged once below
+            avg_gain += gain
+            avg_loss += loss
+            continue
+        elif i == period:
+            # Seed with the simple average of the first period changes
+            avg_gain = (avg_gain + gain) / period
+            avg_loss = (avg_loss + loss) / period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        
+        # RSI = 100 - 100 / (1 + RS), with RS = avg_gain / avg_loss
+        if avg_loss == 0.0:
+            out[i] = 100.0 if avg_gain > 0.0 else np.nan
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_rsi(close_bytes, period):
+    """Wilder's RSI keyed on the raw bytes of a float64 Close array"""
+    close = np.frombuffer(close_bytes, dtype=np.float64)
+    rsi = np.empty(len(close))
+    _wilder_rsi(close, period, rsi)
+    return rsi
+
+
+def compute_rsi(close, period=14):
+    """
+    Wilder's RSI for an array of closing prices
+    
+    Results are memoized on (prices, period), so sweeping RSI thresholds over the
+    same prices only runs the RSI pass once.
+    
+    Args:
+        close: 1-D array of closing prices
+        period: RSI calculation period (default 14 days)
+        
+    Returns:
+        float64 array of RSI values (NaN until the first full period)
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    # Copy so callers can't modify the cached array
+    return _cached_rsi(close.tobytes(), period).copy()
+
+
+def _signal_frame(data, arrays):
+    """
+    Build a new DataFrame of Date (if present), Close and the given arrays
+    
+    The other OHLCV columns are left out and the arrays are not copied.
+    """
+    columns = {}
+    if 'Date' in data.columns:
+        columns['Date'] = data['Date'].to_numpy()
+    columns['Close'] = data['Close'].to_numpy()
+    columns.update(arrays)
+    return pd.DataFrame(columns, index=data.index, copy=False)
+
+
+def signals_from_rsi(rsi, oversold, overbought):
+    """
+    Threshold RSI values into signals
+    
+    Args:
+        rsi: Array of RSI values
+        oversold: Buy (1) below this level
+        overbought: Sell (-1) above this level
+        
+    Returns:
+        int8 array of signals (NaN RSI compares False, so it holds)
+    """
+    return np.where(rsi < oversold, 1,              # Oversold - buy
+                    np.where(rsi > overbought, -1,  # Overbought - sell
+                             0)).astype(np.int8)
+
 
 class MovingAverageCrossover:
     """
@@ -17,31 +295,144 @@ class MovingAverageCrossover:
         self.short_window = short_window
         self.long_window = long_window
     
-    def generate_signals(self, data):
+    def _compute(self, close):
+        """Moving averages and signals for an array of closing prices"""
+        close = np.asarray(close, dtype=np.float64)
+        
+        if HAS_NUMBA:
+            # Both moving averages and the signal in one compiled pass
+            short_ma = np.empty(len(close))
+            long_ma = np.empty(len(close))
+            signal = np.empty(len(close), dtype=np.int8)
+            _ma_cross(close, self.short_window, self.long_window, signal, short_ma, long_ma)
+            return short_ma, long_ma, signal
+        
+        # Without numba the fused loop would be plain Python, so use array ops instead
+        short_ma = _moving_mean(close, self.short_window)
+        long_ma = _moving_mean(close, self.long_window)
+        
+        # Generate signals with masked stores straight into an int8 buffer
+        # Buy (1) when short MA is above long MA (uptrend), sell (-1) when below
+        # (downtrend), hold (0) while either MA is still warming up (NaN compares False)
+        # or the two are equal within MA_TOLERANCE
+        gap = short_ma - long_ma
+        tolerance = MA_TOLERANCE * np.maximum(np.abs(short_ma), np.abs(long_ma))
+        signal = np.zeros(len(close), dtype=np.int8)
+        signal[gap > tolerance] = 1
+        signal[gap < -tolerance] = -1
+        
+        return short_ma, long_ma, signal
+    
+    def signals(self, close):
+        """
+        Generate buy/sell signals straight from closing prices
+        
+        Args:
+            close: 1-D array of closing prices
+            
+        Returns:
+            int8 array of signals (1 = buy, -1 = sell, 0 = hold)
+        """
+        return self._compute(close)[-1]
+    
+    @classmethod
+    def sweep(cls, close, short_windows, long_windows, n_jobs=-1):
+        """
+        Generate signals for every (short_window, long_window) combination
+        
+        Combinations run in parallel worker processes. Only the Close array is
+        sent to the workers, not a DataFrame.
+        
+        Args:
+            close: 1-D array of closing prices
+            short_windows: Short MA periods to try
+            long_windows: Long MA periods to try
+            n_jobs: Number of worker processes (default -1, one per core)
+            
+        Returns:
+            int8 array of shape (len(short_windows) * len(long_windows), len(close)),
+            one row per combination in itertools.product(short_windows, long_windows) order
+        """
+        close = np.ascontiguousarray(close, dtype=np.float64)
+        params = list(product(short_windows, long_windows))
+        
+        if Parallel is None:
+            rows = [cls(short, long).signals(close) for short, long in params]
+        else:
+            rows = Parallel(n_jobs=n_jobs, backend='loky')(
+                delayed(cls(short, long).signals)(close) for short, long in params
+            )
+        
+        return np.array(rows, dtype=np.int8).reshape(len(params), len(close))
+    
+    def batch(self, close_matrix):
+        """
+        Generate signals for many tickers at once
+        
+        With numba, all rows are computed in one kernel with threads sharing the
+        matrix; otherwise each row goes through signals() in turn.
+        
+        Args:
+            close_matrix: 2-D array of closing prices, shape (n_tickers, n_bars),
+                one ticker per row aligned on the same dates
+            
+        Returns:
+            int8 array of signals with the same shape as close_matrix
+        """
+        close_matrix = np.ascontiguousarray(close_matrix, dtype=np.float64)
+        
+        if not HAS_NUMBA:
+            return np.array([self.signals(row) for row in close_matrix],
+                            dtype=np.int8).reshape(close_matrix.shape)
+        
+        signal = np.empty(close_matrix.shape, dtype=np.int8)
+        _batch_ma_cross(close_matrix, self.short_window, self.long_window, signal)
+        return signal
+    
+    def generate_signals_arrays(self, close):
+        """
+        Generate MA crossover indicators and signals as plain arrays
+        
+        Args:
+            close: 1-D array of closing prices
+            
+        Returns:
+            Dict of aligned arrays: Short_MA and Long_MA (float32), Signal (int8)
+        """
+        short_ma, long_ma, signal = self._compute(close)
+        
+        # Stored as float32 - plenty for prices at half the size. Signals are
+        # computed from the float64 values
+        return {
+            'Short_MA': short_ma.astype(np.float32),
+            'Long_MA': long_ma.astype(np.float32),
+            'Signal': signal
+        }
+    
+    def generate_signals(self, data, inplace=False, signals_only=False):
         """
         Generate buy/sell signals based on MA crossover
         
         Args:
             data: DataFrame with 'Close' column
+            inplace: Add the new columns to data itself. By default they go on a
+                shallow copy, which shares the existing columns with data
+            signals_only: Return a new DataFrame with just Date, Close and the
+                added columns instead of carrying the other OHLCV columns along
+                (inplace is ignored)
             
         Returns:
             DataFrame with added columns: Short_MA, Long_MA, Signal
         """
-        df = data.copy()
-        
-        # Calculate moving averages
-        df['Short_MA'] = df['Close'].rolling(window=self.short_window).mean()
-        df['Long_MA'] = df['Close'].rolling(window=self.long_window).mean()
-        
-        # Initialize signal column
-        df['Signal'] = 0
+        arrays = self.generate_signals_arrays(data['Close'].to_numpy())
+        if signals_only:
+            return _signal_frame(data, arrays)
         
-        # Generate signals based on MA relationship
-        # Buy when short MA is above long MA (uptrend)
-        df.loc[df['Short_MA'] > df['Long_MA'], 'Signal'] = 1
+        # Only new columns are written, so a shallow copy is enough
+        df = data if inplace else data.copy(deep=False)
         
-        # Sell when short MA is below long MA (downtrend)
-        df.loc[df['Short_MA'] < df['Long_MA'], 'Signal'] = -1
+        for name, values in arrays.items():
+            df[name] = values
         
         return df
 
@@ -64,39 +455,92 @@ class RSIStrategy:
         self.oversold = oversold
         self.overbought = overbought
     
-    def generate_signals(self, data):
+    def _compute(self, close):
+        """RSI and signals for an array of closing prices"""
+        # Calculate RSI with Wilder's smoothing (cached per prices and period)
+        rsi = compute_rsi(close, self.period)
+        
+        # Generate signals
+        signal = signals_from_rsi(rsi, self.oversold, self.overbought)
+        
+        return rsi, signal
+    
+    def signals(self, close):
         """
-        Generate buy/sell signals based on RSI
+        Generate buy/sell signals straight from closing prices
         
         Args:
-            data: DataFrame with 'Close' column
+            close: 1-D array of closing prices
             
         Returns:
-            DataFrame with added columns: RSI, Signal
+            int8 array of signals (1 = buy, -1 = sell, 0 = hold)
         """
-        df = data.copy()
+        return self._compute(close)[-1]
+    
+    @classmethod
+    def sweep(cls, close, oversold_levels, overbought_levels, period=14):
+        """
+        Generate signals for every (oversold, overbought) combination
         
-        # Calculate price changes
-        delta = df['Close'].diff()
+        RSI is computed once and each combination is only a thresholding pass,
+        so this runs serially - worker processes would cost more than they save.
         
-        # Separate gains and losses
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
+        Args:
+            close: 1-D array of closing prices
+            oversold_levels: Oversold thresholds to try
+            overbought_levels: Overbought thresholds to try
+            period: RSI calculation period (default 14 days)
+            
+        Returns:
+            int8 array of shape (len(oversold_levels) * len(overbought_levels), len(close)),
+            one row per combination in itertools.product(oversold_levels, overbought_levels) order
+        """
+        rsi = compute_rsi(close, period)
+        params = list(product(oversold_levels, overbought_levels))
         
-        # Calculate average gain and loss
-        avg_gain = gain.rolling(window=self.period).mean()
-        avg_loss = loss.rolling(window=self.period).mean()
+        grid = np.empty((len(params), len(rsi)), dtype=np.int8)
+        for row, (oversold, overbought) in enumerate(params):
+            grid[row] = signals_from_rsi(rsi, oversold, overbought)
         
-        # Calculate RS (Relative Strength)
-        rs = avg_gain / avg_loss
+        return grid
+    
+    def generate_signals_arrays(self, close):
+        """
+        Generate RSI and signals as plain arrays
         
-        # Calculate RSI
-        df['RSI'] = 100 - (100 / (1 + rs))
+        Args:
+            close: 1-D array of closing prices
+            
+        Returns:
+            Dict of aligned arrays: RSI (float32), Signal (int8)
+        """
+        rsi, signal = self._compute(close)
+        return {'RSI': rsi.astype(np.float32), 'Signal': signal}
+    
+    def generate_signals(self, data, inplace=False, signals_only=False):
+        """
+        Generate buy/sell signals based on RSI
         
-        # Generate signals
-        df['Signal'] = 0
-        df.loc[df['RSI'] < self.oversold, 'Signal'] = 1   # Oversold - buy
-        df.loc[df['RSI'] > self.overbought, 'Signal'] = -1 # Overbought - sell
+        Args:
+            data: DataFrame with 'Close' column
+            inplace: Add the new columns to data itself. By default they go on a
+                shallow copy, which shares the existing columns with data
+            signals_only: Return a new DataFrame with just Date, Close and the
+                added columns instead of carrying the other OHLCV columns along
+                (inplace is ignored)
+            
+        Returns:
+            DataFrame with added columns: RSI, Signal
+        """
+        arrays = self.generate_signals_arrays(data['Close'].to_numpy())
+        if signals_only:
+            return _signal_frame(data, arrays)
+        
+        # Only new columns are written, so a shallow copy is enough
+        df = data if inplace else data.copy(deep=False)
+        
+        for name, values in arrays.items():
+            df[name] = values
         
         return df
 
@@ -108,24 +552,232 @@ class MomentumStrategy:
     Sell when price went down yesterday
     """
     
-    def generate_signals(self, data):
+    def _compute(self, close, include_return=False):
+        """Daily returns (None unless include_return) and signals for an array of closing prices"""
+        close = np.asarray(close, dtype=np.float64)
+        
+        # Daily price change (the first day has none). Its sign is the sign of the
+        # daily return, so signals need no division
+        diff = np.empty_like(close)
+        diff[:1] = 0.0
+        np.subtract(close[1:], close[:-1], out=diff[1:])
+        
+        # Generate signals: buy on an up day, sell on a down day
+        signal = np.zeros(len(close), dtype=np.int8)
+        signal[diff > 0] = 1
+        signal[diff < 0] = -1
+        
+        returns = None
+        if include_return:
+            returns = np.full(len(close), np.nan)
+            returns[1:] = diff[1:] / close[:-1]
+        
+        return returns, signal
+    
+    def signals(self, close):
+        """
+        Generate buy/sell signals straight from closing prices
+        
+        Args:
+            close: 1-D array of closing prices
+            
+        Returns:
+            int8 array of signals (1 = buy, -1 = sell, 0 = hold)
+        """
+        return self._compute(close)[-1]
+    
+    def generate_signals_arrays(self, close, include_return=False):
+        """
+        Generate momentum signals (and optionally daily returns) as plain arrays
+        
+        Args:
+            close: 1-D array of closing prices
+            include_return: Also return the daily Return array
+            
+        Returns:
+            Dict of aligned arrays: Signal (int8), plus Return (float32) if include_return
+        """
+        returns, signal = self._compute(close, include_return)
+        
+        arrays = {}
+        if include_return:
+            arrays['Return'] = returns.astype(np.float32)
+        arrays['Signal'] = signal
+        return arrays
+    
+    def generate_signals(self, data, inplace=False, include_return=False, signals_only=False):
         """
         Generate buy/sell signals based on daily returns
         
         Args:
             data: DataFrame with 'Close' column
+            inplace: Add the new columns to data itself. By default they go on a
+                shallow copy, which shares the existing columns with data
+            include_return: Also add the daily Return column
+            signals_only: Return a new DataFrame with just Date, Close and the
+                added columns instead of carrying the other OHLCV columns along
+                (inplace is ignored)
             
         Returns:
-            DataFrame with added columns: Return, Signal
+            DataFrame with added columns: Signal (and Return if include_return)
         """
-        df = data.copy()
+        arrays = self.generate_signals_arrays(data['Close'].to_numpy(), include_return)
+        if signals_only:
+            return _signal_frame(data, arrays)
         
-        # Calculate daily returns
-        df['Return'] = df['Close'].pct_change()
+        # Only new columns are written, so a shallow copy is enough
+        df = data if inplace else data.copy(deep=False)
         
-        # Generate signals
-        df['Signal'] = 0
-        df.loc[df['Return'] > 0, 'Signal'] = 1   # Buy signal
-        df.loc[df['Return'] < 0, 'Signal'] = -1  # Sell signal
+        for name, values in arrays.items():
+            df[name] = values
+        
+        return df
+
+
+class OnlineMACrossover:
+    """
+    Streaming Moving Average Crossover for live trading
+    
+    Keeps running sums over a ring buffer of recent prices, so each new bar is
+    O(1) instead of recomputing the moving averages over the whole history.
+    Produces the same signals as MovingAverageCrossover bar by bar.
+    """
+    
+    def __init__(self, short_window=20, long_window=50):
+        """
+        Args:
+            short_window: Period for short moving average (default 20 days)
+            long_window: Period for long moving average (default 50 days)
+        """
+        self.short_window = short_window
+        self.long_window = long_window
+        
+        # One extra slot so the price leaving each window is still available
+        self._prices = collections.deque(maxlen=max(short_window, long_window) + 1)
+        self._count = 0
+        self._short_state = np.zeros(6)
+        self._long_state = np.zeros(6)
+    
+    def update(self, price):
+        """
+        Add the latest closing price
+        
+        Args:
+            price: Closing price of the new bar
+            
+        Returns:
+            Signal for the bar: 1 = buy, -1 = sell, 0 = hold (until both MAs are ready)
+        """
+        price = float(price)
+        self._prices.append(price)
+        self._count += 1
+        
+        # The price that just left each window (NaN while nothing has left yet)
+        old_short = self._prices[-self.short_window - 1] if self._count > self.short_window else np.nan
+        old_long = self._prices[-self.long_window - 1] if self._count > self.long_window else np.nan
+        
+        short_ma = _rolling_mean_update(self._short_state, self.short_window, price, old_short)
+        long_ma = _rolling_mean_update(self._long_state, self.long_window, price, old_long)
+        return int(_cross_signal(short_ma, long_ma))
+
+
+class OnlineRSI:
+    """
+    Streaming RSI strategy for live trading
+    
+    Applies Wilder's recursion one bar at a time, so each update is O(1).
+    Produces the same signals as RSIStrategy bar by bar.
+    """
+    
+    def __init__(self, period=14, oversold=35, overbought=65):
+        """
+        Args:
+            period: RSI calculation period (default 14 days)
+            oversold: RSI level considered oversold (default 35)
+            overbought: RSI level considered overbought (default 65)
+        """
+        self.period = period
+        self.oversold = oversold
+        self.overbought = overbought
+        
+        self.rsi = np.nan
+        self._prev_price = None
+        self._changes = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+    
+    def update(self, price):
+        """
+        Add the latest closing price
+        
+        Args:
+            price: Closing price of the new bar
+            
+        Returns:
+            Signal for the bar: 1 = buy, -1 = sell, 0 = hold (until RSI is ready)
+        """
+        prev_price, self._prev_price = self._prev_price, price
+        if prev_price is None:
+            return 0
+        
+        delta = price - prev_price
+        if delta != delta:
+            # Missing price - treat as no change, like RSIStrategy
+            delta = 0.0
+        gain = max(delta, 0.0)
+        loss = max(-delta, 0.0)
+        self._changes += 1
+        
+        if self._changes < self.period:
+            # Accumulate the first period changes, averaged once below
+            self._avg_gain += gain
+            self._avg_loss += loss
+            return 0
+        elif self._changes == self.period:
+            # Seed with the simple average of the first period changes
+            self._avg_gain = (self._avg_gain + gain) / self.period
+            self._avg_loss = (self._avg_loss + loss) / self.period
+        else:
+            self._avg_gain = (self._avg_gain * (self.period - 1) + gain) / self.period
+            self._avg_loss = (self._avg_loss * (self.period - 1) + loss) / self.period
+        
+        if self._avg_loss == 0.0:
+            self.rsi = 100.0 if self._avg_gain > 0.0 else np.nan
+        else:
+            self.rsi = 100.0 - 100.0 / (1.0 + self._avg_gain / self._avg_loss)
+        
+        if self.rsi < self.oversold:
+            return 1   # Oversold - buy
+        if self.rsi > self.overbought:
+            return -1  # Overbought - sell
+        return 0
+
+
+class OnlineMomentum:
+    """
+    Streaming Momentum strategy for live trading
+    
+    Only remembers the previous close. Produces the same signals as
+    MomentumStrategy bar by bar.
+    """
+    
+    def __init__(self):
+        self._prev_price = None
+    
+    def update(self, price):
+        """
+        Add the latest closing price
+        
+        Args:
+            price: Closing price of the new bar
+            
+        Returns:
+            Signal for the bar: 1 = up day (buy), -1 = down day (sell), 0 otherwise
+        """
+        prev_price, self._prev_price = self._prev_price, price
+        if prev_price is None:
+            return 0
         
-        return df
\ No newline at end of file
+        # Same rule as MomentumStrategy: the sign of the price change
+        change = price - prev_price
+        return 1 if change > 0 else -1 if change < 0 else 0
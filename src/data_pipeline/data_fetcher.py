@@ -1,17 +1,28 @@
 import yfinance as yf
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 import os
+import threading
+
+# Most downloads to run at once when fetching several tickers
+MAX_FETCH_WORKERS = 16
 
 class DataFetcher:
     """Fetches market data from Yahoo Finance"""
     
     def __init__(self, data_dir='data/raw'):
         self.data_dir = data_dir
-        # Create directory if it doesn't exist
-        os.makedirs(data_dir, exist_ok=True)
+        # Downloads are cached in a subdirectory, apart from the files save() writes
+        self.cache_dir = os.path.join(data_dir, 'cache')
+        
+        # Create directories if they don't exist
+        os.makedirs(self.cache_dir, exist_ok=True)
+        
+        # Frames already fetched by this fetcher, keyed by (ticker, start_date, end_date)
+        self._cache = {}
     
-    def fetch_stock_data(self,ticker, start_date, end_date):
+    def fetch_stock_data(self, ticker, start_date, end_date, use_cache=True):
         """
         Fetch historical stock data for a single ticker
         
@@ -19,22 +30,45 @@ class DataFetcher:
             ticker: Stock symbol (e.g., 'AAPL', 'MSFT')
             start_date: Start date as string 'YYYY-MM-DD'
             end_date: End date as string 'YYYY-MM-DD'
+            use_cache: Reuse data already fetched for the same ticker and dates,
+                from memory or from {data_dir}/cache/{ticker}_{start}_{end}.parquet
             
         Returns:
             pandas DataFrame with OHLCV data
         """
+        key = (ticker, start_date, end_date)
+        cache_path = f"{self.cache_dir}/{ticker}_{start_date}_{end_date}.parquet"
+        
+        if use_cache:
+            if key in self._cache:
+                return self._cache[key].copy()
+            
+            if os.path.exists(cache_path):
+                try:
+                    data = pd.read_parquet(cache_path)
+                except ImportError:
+                    # No Parquet engine installed - download instead
+                    pass
+                else:
+                    print(f"✓ Loaded {len(data)} days of data for {ticker} from {cache_path}")
+                    self._cache[key] = data
+                    return data.copy()
+        
         print(f"Fetching data for {ticker}...")
         
-        # Download data using yfinance
-        data = yf.download(ticker, start=start_date, end=end_date, progress=False)
+        # Download data using yfinance. Ticker.history keeps its state on the Ticker
+        # object, unlike yf.download's module-level results dict, so it is safe to
+        # call from several threads at once. yfinance already sends every request
+        # through one process-wide HTTP session, so connections are reused
+        data = yf.Ticker(ticker).history(start=start_date, end=end_date,
+                                         auto_adjust=True, actions=False)
         
         if data.empty:
             print(f"Warning: No data found for {ticker}")
             return None
         
-        # Flatten multi-level columns if they exist
-        if isinstance(data.columns, pd.MultiIndex):
-            data.columns = data.columns.get_level_values(0)
+        # Drop the exchange timezone so dates match yf.download's daily output
+        data.index = data.index.tz_localize(None)
         
         # Add ticker column
         data['Ticker'] = ticker
@@ -43,6 +77,22 @@ class DataFetcher:
         data = data.reset_index()
         
         print(f"✓ Downloaded {len(data)} days of data for {ticker}")
+        
+        if use_cache:
+            # Write to a temp file first so another thread or process reading the
+            # same ticker never sees a partial cache
+            tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                data.to_parquet(tmp_path, index=False)
+                os.replace(tmp_path, cache_path)
+            except (ImportError, OSError):
+                # No Parquet engine or the file can't be written - keep the
+                # in-memory cache only
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            self._cache[key] = data
+            return data.copy()
+        
         return data
         
         
@@ -59,20 +109,106 @@ class DataFetcher:
             Dictionary of {ticker: DataFrame}
         """
         all_data = {}
+        if not tickers:
+            return all_data
+        
+        # Downloads are network-bound, so fetch them side by side in threads
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(tickers))) as executor:
+            futures = {executor.submit(self.fetch_stock_data, ticker, start_date, end_date): ticker
+                       for ticker in tickers}
+            
+            for future in as_completed(futures):
+                ticker = futures[future]
+                # One failed download shouldn't abort the whole batch
+                try:
+                    data = future.result()
+                except Exception as e:
+                    print(f"Warning: Failed to fetch {ticker}: {e}")
+                    continue
+                
+                if data is not None:
+                    all_data[ticker] = data
+        
+        # Keep the order the tickers were requested in
+        return {ticker: all_data[ticker] for ticker in tickers if ticker in all_data}
+    
+    def fetch_multiple_stocks_batch(self, tickers, start_date, end_date):
+        """
+        Fetch data for multiple stocks in a single yfinance batch request
+        
+        yfinance downloads the tickers in parallel inside one call, saving the
+        per-call setup of fetching them one at a time.
+        
+        Args:
+            tickers: List of stock symbols
+            start_date: Start date as string 'YYYY-MM-DD'
+            end_date: End date as string 'YYYY-MM-DD'
+            
+        Returns:
+            Dictionary of {ticker: DataFrame}
+        """
+        if len(tickers) <= 1:
+            return self.fetch_multiple_stocks(tickers, start_date, end_date)
+        
+        print(f"Fetching data for {', '.join(tickers)}...")
+        
+        data = yf.download(tickers, start=start_date, end=end_date, group_by='ticker',
+                           auto_adjust=True, threads=True, progress=False)
+        
+        all_data = {}
         
         for ticker in tickers:
-            data = self.fetch_stock_data(ticker, start_date, end_date)
-            if data is not None:
-                all_data[ticker] = data
+            # Columns are (ticker, field) - pull out this ticker's block. Rows are
+            # aligned across tickers, so drop days this one has no data for
+            if data.empty or ticker not in data.columns.get_level_values(0):
+                ticker_data = pd.DataFrame()
+            else:
+                ticker_data = data.xs(ticker, axis=1, level=0).dropna(how='all')
+            
+            if ticker_data.empty:
+                print(f"Warning: No data found for {ticker}")
+                continue
+            
+            # Add ticker column
+            ticker_data = ticker_data.copy()
+            ticker_data['Ticker'] = ticker
+            
+            # Reset index to make Date a column
+            all_data[ticker] = ticker_data.reset_index()
+            print(f"✓ Downloaded {len(ticker_data)} days of data for {ticker}")
         
         return all_data
     
-    def save_to_csv(self, data, ticker):
-        """Save data to CSV file"""
-        filename = f"{self.data_dir}/{ticker}_{datetime.now().strftime('%Y%m%d')}.csv"
-        data.to_csv(filename, index=False)
+    def save(self, data, ticker, fmt='parquet'):
+        """
+        Save data to a file in data_dir
+        
+        Parquet (the default) is columnar and compressed, so files are smaller
+        and load much faster than CSV, with dtypes preserved.
+        
+        Args:
+            data: DataFrame to save
+            ticker: Stock symbol, used in the filename
+            fmt: 'parquet' or 'csv'
+            
+        Returns:
+            Path of the saved file
+        """
+        filename = f"{self.data_dir}/{ticker}_{datetime.now().strftime('%Y%m%d')}.{fmt}"
+        
+        if fmt == 'parquet':
+            data.to_parquet(filename, engine='pyarrow', compression='zstd', index=False)
+        elif fmt == 'csv':
+            data.to_csv(filename, index=False)
+        else:
+            raise ValueError(f"Unsupported format: {fmt}")
+        
         print(f"✓ Saved to {filename}")
         return filename
+    
+    def save_to_csv(self, data, ticker):
+        """Save data to CSV file"""
+        return self.save(data, ticker, fmt='csv')
 
 
 # Test function - run this to see it work
@@ -94,6 +230,6 @@ if __name__ == "__main__":
         print(f"\nColumns: {list(data.columns)}")
         
         # Save it
-        fetcher.save_to_csv(data, 'AAPL')
+        fetcher.save(data, 'AAPL')
         
-        print("\n✓ SUCCESS! Check your data/raw folder for the CSV file")
\ No newline at end of file
+        print("\n✓ SUCCESS! Check your data/raw folder for the Parquet file")
\ No newline at end of file
@@ -0,0 +1,108 @@
+import contextlib
+import io
+import os
+import shutil
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'backtesting'))
+
+from simple_backtester import SimpleBacktester
+from strategies import MomentumStrategy, MovingAverageCrossover
+
+CSV_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'AAPL_20251217.csv')
+
+
+def load_csv(tmp_path):
+    """Load the bundled AAPL data from a copy, so the Parquet cache lands in tmp_path"""
+    csv_path = str(tmp_path / 'AAPL.csv')
+    shutil.copy(CSV_PATH, csv_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return SimpleBacktester().load_data(csv_path)
+
+
+def run(data, strategy):
+    """Backtest one strategy quietly, returning the backtester and its metrics"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        backtester = SimpleBacktester()
+        data_with_signals = backtester.apply_strategy(data, strategy)
+        backtester.execute_backtest(data_with_signals)
+        final_price = data_with_signals.iloc[-1]['Close']
+        result = backtester.calculate_performance(final_price, data_with_signals)
+    return backtester, data_with_signals, result
+
+
+def pandas_metrics(backtester, data_with_signals):
+    """Sharpe and max drawdown the way the original pandas implementation computed them"""
+    trades_by_date = {}
+    for trade in backtester.trades:
+        trades_by_date.setdefault(trade.Date, []).append(trade)
+    
+    portfolio_values = []
+    cash = backtester.initial_capital
+    shares = 0
+    for date, price in zip(data_with_signals['Date'], data_with_signals['Close'].astype(np.float64)):
+        for trade in trades_by_date.get(date, []):
+            shares = shares + trade.Shares if trade.Action == 'BUY' else 0
+            cash = trade.Cash
+        portfolio_values.append(cash + shares * price)
+    
+    portfolio_series = pd.Series(portfolio_values)
+    daily_returns = (portfolio_series / portfolio_series.shift() - 1).dropna()
+    sharpe_ratio = (daily_returns.mean() / daily_returns.std()) * np.sqrt(252)
+    
+    running_max = portfolio_series.expanding().max()
+    max_drawdown = ((portfolio_series - running_max) / running_max).min() * 100
+    return sharpe_ratio, max_drawdown
+
+
+@pytest.mark.parametrize('strategy', [MomentumStrategy(), MovingAverageCrossover()])
+def test_metrics_match_pandas_with_nan_close(tmp_path, strategy):
+    data = load_csv(tmp_path)
+    data.loc[80, 'Close'] = np.nan
+    
+    backtester, data_with_signals, result = run(data, strategy)
+    sharpe_ratio, max_drawdown = pandas_metrics(backtester, data_with_signals)
+    
+    assert result['sharpe_ratio'] != 0
+    assert result['sharpe_ratio'] == pytest.approx(sharpe_ratio)
+    assert result['max_drawdown'] == pytest.approx(max_drawdown)
+
+
+def test_repeated_dates(tmp_path):
+    data = load_csv(tmp_path)
+    data = pd.concat([data.iloc[:100], data.iloc[99:]], ignore_index=True)
+    
+    _, _, result = run(data, MomentumStrategy())
+    
+    assert result['num_trades'] > 0
+    assert result['sharpe_ratio'] != 0
+
+
+@pytest.mark.parametrize('engine', ['pyarrow', 'c'])
+def test_load_data_coerces_bad_cells(tmp_path, monkeypatch, engine):
+    if engine == 'c':
+        # Without pyarrow, load_data falls back to the C parser
+        monkeypatch.setitem(sys.modules, 'pyarrow', None)
+    
+    lines = open(CSV_PATH).read().splitlines()
+    header = lines[0].split(',')
+    for row, col, value in [(2, 'Volume', ''), (3, 'Close', 'abc'), (4, 'Volume', '100.5')]:
+        cells = lines[row].split(',')
+        cells[header.index(col)] = value
+        lines[row] = ','.join(cells)
+    csv_path = tmp_path / 'AAPL.csv'
+    csv_path.write_text('\n'.join(lines) + '\n')
+    
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = SimpleBacktester().load_data(str(csv_path))
+    
+    assert len(data) == len(lines) - 2
+    assert pd.isna(data.loc[0, 'Volume'])
+    assert np.isnan(data.loc[1, 'Close'])
+    assert data.loc[2, 'Volume'] == 100
+    assert data['Close'].dtype == np.float32
+    assert data['Volume'].dtype == 'Int64'
@@ -0,0 +1,89 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'backtesting'))
+
+from strategies import (MovingAverageCrossover, OnlineMACrossover, OnlineRSI, RSIStrategy,
+                        compute_rsi, signals_from_rsi)
+
+CSV_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'AAPL_20251217.csv')
+
+
+def rolling_signals(close, short_window=20, long_window=50):
+    """Reference crossover signals from pandas rolling().mean()"""
+    close = pd.Series(close)
+    short_ma = close.rolling(window=short_window).mean()
+    long_ma = close.rolling(window=long_window).mean()
+    signal = np.zeros(len(close), dtype=np.int8)
+    signal[short_ma > long_ma] = 1
+    signal[short_ma < long_ma] = -1
+    return signal
+
+
+def flat_close():
+    """A 60-bar ramp followed by 300 bars at one price"""
+    return np.concatenate([np.linspace(90, 100.1, 60), np.full(300, 100.1)])
+
+
+def nan_close():
+    """A random walk with one missing price at bar 100"""
+    close = np.cumsum(np.random.default_rng(0).normal(size=400)) + 100
+    close[100] = np.nan
+    return close
+
+
+def check_all_paths(close):
+    strategy = MovingAverageCrossover()
+    expected = rolling_signals(close)
+    
+    np.testing.assert_array_equal(strategy.signals(close), expected)
+    np.testing.assert_array_equal(strategy.batch(np.vstack([close, close]))[1], expected)
+    
+    online = OnlineMACrossover()
+    np.testing.assert_array_equal([online.update(price) for price in close], expected)
+
+
+def test_ma_flat_prices_hold():
+    close = flat_close()
+    assert not rolling_signals(close)[150:].any()
+    check_all_paths(close)
+
+
+def test_ma_recovers_after_nan():
+    close = nan_close()
+    assert rolling_signals(close)[160:].any()
+    check_all_paths(close)
+
+
+def test_ma_without_numba_matches(monkeypatch):
+    import strategies
+    monkeypatch.setattr(strategies, 'HAS_NUMBA', False)
+    strategy = MovingAverageCrossover()
+    for close in (flat_close(), nan_close()):
+        np.testing.assert_array_equal(strategy.signals(close), rolling_signals(close))
+
+
+def test_rsi_recovers_after_nan():
+    close = nan_close()
+    rsi = compute_rsi(close)
+    assert not np.isnan(rsi[15:]).any()
+    
+    online = OnlineRSI()
+    np.testing.assert_array_equal([online.update(price) for price in close],
+                                  RSIStrategy().signals(close))
+
+
+def test_float32_rsi_gives_same_signals():
+    aapl_close = pd.read_csv(CSV_PATH, skiprows=[1])['Close'].to_numpy(dtype=np.float64)
+    walk_close = np.cumsum(np.random.default_rng(1).normal(size=5000)) + 100
+    
+    for close in (aapl_close, walk_close):
+        rsi = compute_rsi(close)
+        rsi32 = rsi.astype(np.float32)
+        for oversold in range(10, 50, 5):
+            for overbought in range(50, 95, 5):
+                np.testing.assert_array_equal(signals_from_rsi(rsi32, oversold, overbought),
+                                              signals_from_rsi(rsi, oversold, overbought))